@@ -5,10 +5,7 @@ import argparse
 from pathlib import Path
 from textwrap import indent
 
-import nbformat
-
 from .core.config import NbParserConfig
-from .core.read import read_myst_markdown_notebook
 
 
 def quickstart(args: list[str] | None = None):
@@ -106,6 +103,9 @@ def generate_index(children: list[str]) -> str:
 
 def generate_jupyter_notebook() -> str:
     """Generate `notebook.ipynb` content."""
+    # we import this locally, so the CLI is not slowed by its import time
+    import nbformat
+
     nb = nbformat.v4.new_notebook()
     nb["metadata"] = {
         "kernelspec": {
@@ -143,6 +143,11 @@ print("Hello, World!")
 
 
 def md_to_nb(args: list[str] | None = None):
+    # we import these locally, so the CLI is not slowed by their import time
+    import nbformat
+
+    from .core.read import read_myst_markdown_notebook
+
     namespace = create_md_to_nb_cli().parse_args(args)
     path = Path(namespace.inpath).resolve()
     if namespace.outpath:
@@ -589,6 +589,13 @@ class NbParserConfig:
 
         :raises KeyError: if the field is not found
         """
+        if self.cell_metadata_key not in cell_metadata and (
+            "render" not in cell_metadata
+        ):
+            # fast path for the common case of no cell level configuration,
+            # avoiding the field/metadata introspection below
+            return self[field_name]
+
         field: dc.Field = self.__dataclass_fields__[field_name]
 
         cell_key = field.metadata.get("cell_key", field.name)
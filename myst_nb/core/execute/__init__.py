@@ -4,9 +4,6 @@ from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING
 
 from .base import ExecutionError, ExecutionResult, NotebookClientBase  # noqa: F401
-from .cache import NotebookClientCache
-from .direct import NotebookClientDirect
-from .inline import NotebookClientInline
 
 if TYPE_CHECKING:
     from nbformat import NotebookNode
@@ -35,6 +32,12 @@ def create_client(
 
     :returns: The updated notebook, and the (optional) execution metadata.
     """
+    # we import these locally, so that the jupyter-client import chain
+    # is only triggered when execution may actually be required
+    from .cache import NotebookClientCache
+    from .direct import NotebookClientDirect
+    from .inline import NotebookClientInline
+
     # path should only be None when using docutils programmatically,
     # e.g. source="<string>"
     try:
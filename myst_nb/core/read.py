@@ -10,12 +10,12 @@ from typing import Callable, Iterator
 from docutils.parsers.rst import Directive
 from markdown_it.renderer import RendererHTML
 from myst_parser.config.main import MdParserConfig
-from myst_parser.parsers.mdit import create_md_parser
 import nbformat as nbf
 import yaml
 
 from myst_nb.core.config import NbParserConfig
 from myst_nb.core.loggers import DocutilsDocLogger, SphinxDocLogger
+from myst_nb.core.utils import create_md_parser_cached
 
 NOTEBOOK_VERSION = 4
 """The notebook version that readers should return."""
@@ -196,7 +196,7 @@ def read_myst_markdown_notebook(
     inline_config = dc.replace(
         config, disable_syntax=(list(config.disable_syntax) + ["inline"])
     )
-    parser = create_md_parser(inline_config, RendererHTML)
+    parser = create_md_parser_cached(inline_config, RendererHTML)
     tokens = parser.parse(text + "\n")
     lines = text.splitlines()
     md_start_line = 0
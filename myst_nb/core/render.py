@@ -15,26 +15,26 @@ from mimetypes import guess_extension
 import os
 from pathlib import Path
 import re
-from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Sequence, Union
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Iterator, Sequence, Union
 
 from docutils import nodes
 from docutils.parsers.rst import directives as options_spec
 from importlib_metadata import entry_points
 from myst_parser.config.main import MdParserConfig
 from myst_parser.mdit_to_docutils.base import token_line
-from myst_parser.parsers.mdit import create_md_parser
 from nbformat import NotebookNode
 from typing_extensions import Protocol
 
 from myst_nb.core.config import NbParserConfig
-from myst_nb.core.execute import NotebookClientBase
 from myst_nb.core.loggers import LoggerType  # DEFAULT_LOG_TYPE,
-from myst_nb.core.utils import coalesce_streams
+from myst_nb.core.utils import coalesce_streams, create_md_parser_cached
 from myst_nb.warnings_ import MystNBWarnings, create_warning
 
 if TYPE_CHECKING:
     from markdown_it.tree import SyntaxTreeNode
 
+    # do not import at the top-level, since the execution chain is heavy to import
+    from myst_nb.core.execute import NotebookClientBase
     from myst_nb.docutils_ import DocutilsNbRenderer, DocutilsRenderer
     from myst_nb.sphinx_ import SphinxNbRenderer, SphinxRenderer
 
@@ -47,6 +47,12 @@ RENDER_ENTRY_GROUP = "myst_nb.renderers"
 MIME_RENDER_ENTRY_GROUP = "myst_nb.mime_renderers"
 _ANSI_RE = re.compile("\x1b\\[(.*?)([@-~])")
 _QUOTED_RE = re.compile(r"^([\"']).*\1$")
+# TODO do we need this -/_ duplication of tag names, or can we deprecate one?
+_REMOVE_INPUT_TAGS = frozenset({"remove_input", "remove-input"})
+_REMOVE_OUTPUT_TAGS = frozenset({"remove_output", "remove-output"})
+
+_CELL_CLASSES_EMPTY = ("cell",)
+"""The classes applied to an untagged code cell (the common case)."""
 
 
 class MditRenderMixin:
@@ -129,31 +135,35 @@ class MditRenderMixin:
         """Render a notebook code cell."""
         cell_index = token.meta["index"]
         cell_line = token_line(token, 0) or None
-        tags = token.meta["metadata"].get("tags", [])
+        metadata = token.meta["metadata"]
+        tags_list = metadata.get("tags", [])
+        # frozenset gives O(1) membership tests for the checks below
+        tags = frozenset(tags_list)
+        # hoist the repeated attribute lookups into locals
+        get_cell_level_config = self.get_cell_level_config
+        add_line_and_source_path = self.add_line_and_source_path
 
         exec_count, outputs = self._get_nb_code_cell_outputs(token)
 
-        classes = ["cell"]
-        for tag in tags:
-            classes.append(f"tag_{tag.replace(' ', '_')}")
+        if tags_list:
+            classes = ["cell", *(f"tag_{tag.replace(' ', '_')}" for tag in tags_list)]
+        else:
+            # fast path, avoiding the generator for the (common) untagged cell
+            classes = list(_CELL_CLASSES_EMPTY)
 
-        # TODO do we need this -/_ duplication of tag names, or can we deprecate one?
         hide_cell = "hide-cell" in tags
-        remove_input = (
-            self.get_cell_level_config(
-                "remove_code_source", token.meta["metadata"], line=cell_line
-            )
-            or ("remove_input" in tags)
-            or ("remove-input" in tags)
+        remove_input = not tags.isdisjoint(_REMOVE_INPUT_TAGS) or (
+            get_cell_level_config("remove_code_source", metadata, line=cell_line)
         )
         hide_input = "hide-input" in tags
-        remove_output = (
-            self.get_cell_level_config(
-                "remove_code_outputs", token.meta["metadata"], line=cell_line
+        if outputs or remove_input:
+            remove_output = not tags.isdisjoint(_REMOVE_OUTPUT_TAGS) or (
+                get_cell_level_config("remove_code_outputs", metadata, line=cell_line)
             )
-            or ("remove_output" in tags)
-            or ("remove-output" in tags)
-        )
+        else:
+            # with no outputs (and the input kept) the flag is never acted on,
+            # so skip the tag and configuration lookups
+            remove_output = False
         hide_output = "hide-output" in tags
 
         # if we are remove both the input and output, we can skip the cell
@@ -176,28 +186,28 @@ class MditRenderMixin:
             cell_index=cell_index,
             # TODO some way to use this to allow repr of count in outputs like HTML?
             exec_count=exec_count,
-            cell_metadata=token.meta["metadata"],
+            cell_metadata=metadata,
             classes=classes,
         )
         if hide_mode:
             cell_container["hide_mode"] = hide_mode
-            code_prompt_show = self.get_cell_level_config(
-                "code_prompt_show", token.meta["metadata"], line=cell_line
+            code_prompt_show = get_cell_level_config(
+                "code_prompt_show", metadata, line=cell_line
             )
-            code_prompt_hide = self.get_cell_level_config(
-                "code_prompt_hide", token.meta["metadata"], line=cell_line
+            code_prompt_hide = get_cell_level_config(
+                "code_prompt_hide", metadata, line=cell_line
             )
             cell_container["prompt_show"] = code_prompt_show
             cell_container["prompt_hide"] = code_prompt_hide
 
-        self.add_line_and_source_path(cell_container, token)
+        add_line_and_source_path(cell_container, token)
         with self.current_node_context(cell_container, append=True):
             # render the code source code
             if not remove_input:
                 cell_input = nodes.container(
                     nb_element="cell_code_source", classes=["cell_input"]
                 )
-                self.add_line_and_source_path(cell_input, token)
+                add_line_and_source_path(cell_input, token)
                 with self.current_node_context(cell_input, append=True):
                     self._render_nb_cell_code_source(token)
 
@@ -206,7 +216,7 @@ class MditRenderMixin:
                 cell_output = nodes.container(
                     nb_element="cell_code_output", classes=["cell_output"]
                 )
-                self.add_line_and_source_path(cell_output, token)
+                add_line_and_source_path(cell_output, token)
                 with self.current_node_context(cell_output, append=True):
                     self._render_nb_cell_code_outputs(token, outputs)
 
@@ -259,7 +269,12 @@ class MditRenderMixin:
 
         exec_count, outputs = self.nb_client.code_cell_outputs(cell_index)
 
-        if self.get_cell_level_config("merge_streams", token.meta["metadata"], line):
+        # note the check for a stream output, to avoid the call and list rebuild
+        # in the common case of cells with only display/execute_result outputs
+        # (a single stream must still be processed, for \r and \b characters)
+        if any(output["output_type"] == "stream" for output in outputs) and (
+            self.get_cell_level_config("merge_streams", token.meta["metadata"], line)
+        ):
             # TODO should this be saved on the output notebook
             outputs = coalesce_streams(outputs)
 
@@ -398,6 +413,33 @@ class NbElementRenderer:
         else:
             return str(filepath)
 
+    @contextmanager
+    def write_file_streamed(
+        self, path: list[str], overwrite=False, exists_ok=False
+    ) -> Iterator[IO[bytes]]:
+        """Open a file in the external output folder, for streamed writing.
+
+        Unlike `write_file`, the content does not need to be held in memory
+        up-front, so large files can be serialized directly to disk.
+
+        :param path: the path to write the file to, relative to the output folder
+        :param overwrite: whether to overwrite an existing file
+        :param exists_ok: whether to ignore an existing file if overwrite is False
+        """
+        output_folder = self.config.output_folder
+        filepath = Path(output_folder).joinpath(*path)
+        if not output_folder or (filepath.exists() and not overwrite and exists_ok):
+            # do not output anything if output_folder is not set (docutils only)
+            with open(os.devnull, "wb") as handle:
+                yield handle
+        elif filepath.exists() and not overwrite:
+            # TODO raise or just report?
+            raise FileExistsError(f"File already exists: {filepath}")
+        else:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with filepath.open("wb") as handle:
+                yield handle
+
     def add_js_file(self, key: str, uri: str | None, kwargs: dict[str, str]) -> None:
         """Register a JavaScript file to include in the HTML output of this document.
 
@@ -810,13 +852,13 @@ class NbElementRenderer:
             elif fmt == "commonmark":
                 # use an isolated, CommonMark only, parser
                 self.renderer.md_config = MdParserConfig(commonmark_only=True)
-                self.renderer.md = create_md_parser(
+                self.renderer.md = create_md_parser_cached(
                     self.renderer.md_config, self.renderer.__class__
                 )
             elif fmt == "gfm":
                 # use an isolated, GitHub Flavoured Markdown only, parser
                 self.renderer.md_config = MdParserConfig(gfm_only=True)
-                self.renderer.md = create_md_parser(
+                self.renderer.md = create_md_parser_cached(
                     self.renderer.md_config, self.renderer.__class__
                 )
             else:
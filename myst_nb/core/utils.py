@@ -1,13 +1,115 @@
 """Shared utilities."""
 from __future__ import annotations
 
+import dataclasses as dc
+import io
 import re
+from typing import IO, Any
 
+from markdown_it import MarkdownIt
+from myst_parser.config.main import MdParserConfig
+from myst_parser.parsers.mdit import create_md_parser
 from nbformat import NotebookNode
 
+try:
+    # optional fast path for JSON encoding of notebooks
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 _RGX_CARRIAGERETURN = re.compile(r".*\r(?=[^\n])")
 _RGX_BACKSPACE = re.compile(r"[^\n]\b")
 
+_MD_PARSER_CACHE_SIZE = 32
+_MD_PARSER_CACHE: dict = {}
+
+
+def config_fingerprint(config: Any) -> tuple:
+    """Return a hashable fingerprint of a dataclass configuration instance.
+
+    All fields are included by value, notably also those declared with
+    ``repr=False`` (such as ``MdParserConfig.sub_delimiters``),
+    which ``str(config)`` would omit.
+    """
+    return (
+        type(config),
+        tuple(repr(getattr(config, field.name)) for field in dc.fields(config)),
+    )
+
+
+def create_md_parser_cached(config: MdParserConfig, renderer: type) -> MarkdownIt:
+    """Return a markdown-it parser for the config and renderer class, memoized.
+
+    ``create_md_parser`` re-registers every syntax plugin on each call,
+    while builds typically share a single markdown configuration across
+    hundreds of notebooks, so cache the parser keyed on a fingerprint of
+    the config. Callers are expected to (re)assign ``parser.options``
+    entries per parse, as they already do for a fresh parser.
+    """
+    key = (renderer, config_fingerprint(config))
+    if key not in _MD_PARSER_CACHE:
+        while len(_MD_PARSER_CACHE) >= _MD_PARSER_CACHE_SIZE:
+            _MD_PARSER_CACHE.pop(next(iter(_MD_PARSER_CACHE)))
+        _MD_PARSER_CACHE[key] = create_md_parser(config, renderer)
+    return _MD_PARSER_CACHE[key]
+
+
+def write_notebook_json(notebook: NotebookNode, stream: IO[bytes]) -> None:
+    """Serialize a notebook as JSON to a binary stream (utf8 encoded).
+
+    When orjson is installed, it is used to encode directly to bytes
+    (its encoder is significantly faster than the stdlib json module,
+    which matters for notebooks with large base64 outputs);
+    otherwise fall back to ``nbformat.write``.
+    The two paths are read-equivalent (see ``tests/test_utils.py``),
+    but not byte-identical: orjson only supports 2-space indents
+    (nbformat uses 1), and multi-line strings are not split into lists.
+    Values orjson cannot encode (e.g. integers exceeding 64-bit)
+    are also handled by the fallback.
+    """
+    if orjson is not None:
+        # mirror nbformat's output semantics: transient keys are stripped,
+        # keys are sorted and the document is newline terminated.
+        # only the mappings that key-stripping touches are (shallow) copied,
+        # to avoid deep-copying the (potentially large) notebook;
+        # see ``nbformat.v4.nbjson.strip_transient`` for the stripped keys
+        nb: dict = dict(notebook)
+        metadata = dict(nb["metadata"])
+        for transient_key in ("orig_nbformat", "orig_nbformat_minor", "signature"):
+            metadata.pop(transient_key, None)
+        nb["metadata"] = metadata
+        nb["cells"] = [
+            {
+                **cell,
+                "metadata": {
+                    key: value
+                    for key, value in cell["metadata"].items()
+                    if key != "trusted"
+                },
+            }
+            if "trusted" in cell["metadata"]
+            else cell
+            for cell in nb["cells"]
+        ]
+        try:
+            encoded = orjson.dumps(
+                nb, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        except TypeError:
+            # orjson cannot encode everything the stdlib can
+            # (notably integers exceeding 64-bit), so fall back below
+            pass
+        else:
+            stream.write(encoded)
+            stream.write(b"\n")
+            return
+
+    # we import this locally, so the CLI is not slowed by its import time
+    import nbformat
+
+    with io.TextIOWrapper(stream, encoding="utf-8") as handle:
+        nbformat.write(notebook, handle)
+
 
 def coalesce_streams(outputs: list[NotebookNode]) -> list[NotebookNode]:
     """Merge all stream outputs with shared names into single streams.
@@ -22,15 +124,22 @@ def coalesce_streams(outputs: list[NotebookNode]) -> list[NotebookNode]:
 
     new_outputs = []
     streams: dict[str, NotebookNode] = {}
+    # accumulate text chunks per stream and join once at the end,
+    # rather than repeated (quadratic) string concatenation
+    texts: dict[str, list[str]] = {}
     for output in outputs:
         if output["output_type"] == "stream":
-            if output["name"] in streams:
-                streams[output["name"]]["text"] += output["text"]
+            name = output["name"]
+            if name in streams:
+                texts[name].append(output["text"])
             else:
                 new_outputs.append(output)
-                streams[output["name"]] = output
+                streams[name] = output
+                texts[name] = [output["text"]]
         else:
             new_outputs.append(output)
+    for name, output in streams.items():
+        output["text"] = "".join(texts[name])
 
     # process \r and \b characters
     for output in streams.values():
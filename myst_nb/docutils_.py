@@ -1,30 +1,34 @@
 """The docutils parser implementation for myst-nb."""
 from __future__ import annotations
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass, field
 from functools import lru_cache, partial
+import hashlib
 from importlib import resources as import_resources
+import json
 import os
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
 from docutils import nodes
 from docutils.core import default_description, publish_cmdline
 from docutils.parsers.rst.directives import _directives
 from docutils.parsers.rst.roles import _roles
+from docutils.utils.code_analyzer import Lexer, LexerError, NumberLines
 from markdown_it.token import Token
 from markdown_it.tree import SyntaxTreeNode
 from myst_parser.config.main import MdParserConfig, merge_file_level
 from myst_parser.mdit_to_docutils.base import DocutilsRenderer, token_line
 from myst_parser.parsers.docutils_ import Parser as MystParser
 from myst_parser.parsers.docutils_ import create_myst_config, create_myst_settings_spec
-from myst_parser.parsers.mdit import create_md_parser
-import nbformat
 from nbformat import NotebookNode
 from pygments.formatters import get_formatter_by_name
 
 from myst_nb import static
-from myst_nb.core.config import NbParserConfig
-from myst_nb.core.execute import create_client
+from myst_nb.core.config import NbParserConfig, Section
 from myst_nb.core.loggers import DocutilsDocLogger  # DEFAULT_LOG_TYPE,
 from myst_nb.core.nb_to_tokens import nb_node_to_dict, notebook_to_tokens
 from myst_nb.core.read import (
@@ -41,6 +45,11 @@ from myst_nb.core.render import (
     get_mime_priority,
     load_renderer,
 )
+from myst_nb.core.utils import (
+    config_fingerprint,
+    create_md_parser_cached,
+    write_notebook_json,
+)
 from myst_nb.ext.eval import load_eval_docutils
 from myst_nb.ext.glue import load_glue_docutils
 from myst_nb.warnings_ import MystNBWarnings, create_warning
@@ -49,6 +58,144 @@ DOCUTILS_EXCLUDED_ARGS = list(
     {f.name for f in NbParserConfig.get_fields() if f.metadata.get("docutils_exclude")}
 )
 
+_UNSET = object()
+
+_CONFIG_CACHE_SIZE = 32
+_CONFIG_CACHE: dict[tuple, Any] = {}
+
+
+def _create_myst_config_cached(
+    settings: Any, config_cls: type = MdParserConfig, prefix: str = "myst_"
+):
+    """Create a configuration instance from the given settings, memoized.
+
+    ``create_myst_config`` re-walks every config field per call, but the
+    settings are invariably identical for each parse within a process,
+    so cache the built config keyed on the relevant setting values.
+    Configs are treated as immutable downstream (updates go through
+    ``copy``/``merge_file_level``), so the cached instance can be shared.
+    """
+    key = (
+        config_cls,
+        prefix,
+        tuple(
+            (field.name, repr(value))
+            for field in config_cls.get_fields()
+            if (value := getattr(settings, f"{prefix}{field.name}", _UNSET))
+            is not _UNSET
+        ),
+    )
+    if key not in _CONFIG_CACHE:
+        while len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+        _CONFIG_CACHE[key] = create_myst_config(settings, config_cls, prefix)
+    return _CONFIG_CACHE[key]
+
+
+_NB_READ_CACHE_SIZE = 128
+_NB_READ_CACHE: dict[tuple[str, bool, tuple], NotebookNode] = {}
+
+_NB_EXEC_CACHE_SIZE = 32
+_NB_EXEC_CACHE: dict[tuple[str, tuple], NotebookNode] = {}
+
+
+_WRITE_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _submit_write(write: Callable[[], Any], logger: DocutilsDocLogger) -> None:
+    """Submit a file write to a background worker thread.
+
+    This takes the (serialization and) write of the processed notebook off the
+    parse critical path; pending writes are flushed before process exit.
+    Failures on the worker thread (e.g. permissions, disk full) are reported
+    through the document logger, rather than raising out of the parse.
+    """
+    global _WRITE_EXECUTOR
+    if _WRITE_EXECUTOR is None:
+        _WRITE_EXECUTOR = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mystnb_write"
+        )
+        atexit.register(_WRITE_EXECUTOR.shutdown, wait=True)
+
+    def _report_failure(future) -> None:
+        exception = future.exception()
+        if exception is not None:
+            logger.error(f"Writing notebook output failed: {exception}")
+
+    _WRITE_EXECUTOR.submit(write).add_done_callback(_report_failure)
+
+
+def _nb_code_hash(notebook: NotebookNode) -> str:
+    """Hash the code-cell sources and kernelspec of a notebook.
+
+    Notebooks with the same hash should produce the same execution outputs,
+    regardless of changes to their markdown content.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for cell in notebook.cells:
+        if cell["cell_type"] == "code":
+            hasher.update(cell["source"].encode("utf-8"))
+            hasher.update(b"\0")
+    hasher.update(
+        json.dumps(notebook.metadata.get("kernelspec", {}), sort_keys=True).encode(
+            "utf-8"
+        )
+    )
+    return hasher.hexdigest()
+
+
+def _exec_config_fingerprint(nb_config: NbParserConfig) -> tuple:
+    """Return a fingerprint of the execution-relevant configuration fields.
+
+    Outputs executed under one configuration (timeouts, allowed errors,
+    exclusion patterns, ...) must not be re-used under another.
+    """
+    return tuple(
+        repr(getattr(nb_config, field.name))
+        for field in NbParserConfig.get_fields()
+        if Section.execute in field.metadata.get("sections", ())
+    )
+
+
+def _populate_outputs_from_cache(notebook: NotebookNode, cached: NotebookNode) -> None:
+    """Copy execution outputs from a cached notebook with identical code cells."""
+    cached_code_cells = iter(
+        cell for cell in cached.cells if cell["cell_type"] == "code"
+    )
+    for cell in notebook.cells:
+        if cell["cell_type"] == "code":
+            cached_cell = next(cached_code_cells)
+            cell["outputs"] = deepcopy(cached_cell.get("outputs", []))
+            cell["execution_count"] = cached_cell.get("execution_count", None)
+    if "language_info" in cached.metadata and "language_info" not in notebook.metadata:
+        notebook.metadata["language_info"] = deepcopy(cached.metadata["language_info"])
+
+
+def _read_notebook_cached(
+    read: Callable[[str], NotebookNode],
+    inputstring: str,
+    read_as_md: bool,
+    md_config: MdParserConfig,
+) -> NotebookNode:
+    """Read a notebook from a string, memoized at the process level.
+
+    Docutils tooling may re-invoke the parser on an unchanged source
+    (e.g. in preview/watch modes), so cache the parsed notebook keyed on a
+    digest of the input and the reader configuration.
+    Copies are stored/returned, so that downstream mutation of the notebook
+    (e.g. execution) does not leak into the cache.
+    """
+    key = (
+        hashlib.blake2b(inputstring.encode("utf-8"), digest_size=16).hexdigest(),
+        read_as_md,
+        config_fingerprint(md_config),
+    )
+    if key not in _NB_READ_CACHE:
+        while len(_NB_READ_CACHE) >= _NB_READ_CACHE_SIZE:
+            _NB_READ_CACHE.pop(next(iter(_NB_READ_CACHE)))
+        _NB_READ_CACHE[key] = read(inputstring)
+    return deepcopy(_NB_READ_CACHE[key])
+
 
 @dataclass
 class DocutilsApp:
@@ -103,6 +250,9 @@ class Parser(MystParser):
         :param inputstring: The source string to parse
         :param document: The root docutils node to add AST elements to
         """
+        # we import this locally, so the CLI is not slowed by its import time
+        from myst_nb.core.execute import NotebookClientBase, create_client
+
         document_source = document["source"]
 
         # get a logger for this document
@@ -110,14 +260,16 @@ class Parser(MystParser):
 
         # get markdown parsing configuration
         try:
-            md_config = create_myst_config(document.settings)
+            md_config = _create_myst_config_cached(document.settings)
         except (TypeError, ValueError) as error:
             logger.error(f"myst configuration invalid: {error.args[0]}")
             md_config = MdParserConfig()
 
         # get notebook rendering configuration
         try:
-            nb_config = create_myst_config(document.settings, NbParserConfig, "nb_")
+            nb_config = _create_myst_config_cached(
+                document.settings, NbParserConfig, "nb_"
+            )
         except (TypeError, ValueError) as error:
             logger.error(f"myst-nb configuration invalid: {error.args[0]}")
             nb_config = NbParserConfig()
@@ -136,7 +288,9 @@ class Parser(MystParser):
             )
         else:
             nb_reader = NbReader(standard_nb_read, md_config)
-        notebook = nb_reader.read(inputstring)
+        notebook = _read_notebook_cached(
+            nb_reader.read, inputstring, nb_config.read_as_md, md_config
+        )
 
         # update the global markdown config with the file-level config
         warning = lambda wtype, msg: create_warning(  # noqa: E731
@@ -162,7 +316,7 @@ class Parser(MystParser):
                 )
 
         # Setup the markdown parser
-        mdit_parser = create_md_parser(nb_reader.md_config, DocutilsNbRenderer)
+        mdit_parser = create_md_parser_cached(nb_reader.md_config, DocutilsNbRenderer)
         mdit_parser.options["document"] = document
         mdit_parser.options["nb_config"] = nb_config
         mdit_renderer: DocutilsNbRenderer = mdit_parser.renderer  # type: ignore
@@ -184,9 +338,36 @@ class Parser(MystParser):
         # note, this does not assume that the notebook has been executed yet
         mdit_tokens = notebook_to_tokens(notebook, mdit_parser, mdit_env, logger)
 
-        # open the notebook execution client,
-        # this may execute the notebook immediately or during the page render
-        with create_client(notebook, document_source, nb_config, logger) as nb_client:
+        # in 'auto' mode, re-use outputs from a previous parse with identical
+        # code cells (e.g. only the markdown changed), to skip kernel startup
+        exec_cache_key = None
+        exec_cache_hit = False
+        if nb_config.execution_mode == "auto":
+            exec_cache_key = (
+                _nb_code_hash(notebook),
+                _exec_config_fingerprint(nb_config),
+            )
+            if exec_cache_key in _NB_EXEC_CACHE:
+                logger.info("Re-using execution outputs (code cells unchanged)")
+                _populate_outputs_from_cache(notebook, _NB_EXEC_CACHE[exec_cache_key])
+                exec_cache_hit = True
+
+        if exec_cache_hit:
+            # the grafted outputs are known to be execution-complete, so bypass
+            # create_client: its 'auto' mode heuristic re-executes whenever any
+            # code cell has no outputs, which legitimately executed cells
+            # (plain assignments, imports) commonly do
+            try:
+                source_path = Path(document_source)
+                path = source_path if source_path.is_file() else None
+            except OSError:
+                path = None  # occurs on Windows for `source="<string>"`
+            client_ctx = NotebookClientBase(notebook, path, nb_config, logger)
+        else:
+            # open the notebook execution client,
+            # this may execute the notebook immediately or during the page render
+            client_ctx = create_client(notebook, document_source, nb_config, logger)
+        with client_ctx as nb_client:
             mdit_parser.options["nb_client"] = nb_client
             # convert to docutils AST, which is added to the document
             mdit_renderer.render(mdit_tokens, mdit_parser.options, mdit_env)
@@ -195,10 +376,29 @@ class Parser(MystParser):
         if nb_client.exec_metadata:
             document["nb_exec_data"] = nb_client.exec_metadata
 
+        # cache the executed notebook, unless the execution failed
+        if (exec_cache_key is not None and not exec_cache_hit) and (
+            nb_client.exec_metadata is None or nb_client.exec_metadata["succeeded"]
+        ):
+            while len(_NB_EXEC_CACHE) >= _NB_EXEC_CACHE_SIZE:
+                _NB_EXEC_CACHE.pop(next(iter(_NB_EXEC_CACHE)))
+            _NB_EXEC_CACHE[exec_cache_key] = deepcopy(nb_client.notebook)
+
         if nb_config.output_folder:
             # write final (updated) notebook to output folder (utf8 is standard encoding)
-            content = nbformat.writes(notebook).encode("utf-8")
-            nb_renderer.write_file(["processed.ipynb"], content, overwrite=True)
+            # serialized and written on a worker thread, off the parse critical path.
+            # the destination is resolved eagerly, as the write must only depend
+            # on parse-local state: shared state (e.g. the cached md parser's
+            # options["nb_config"]) may be reassigned by a subsequent parse
+            # before the worker thread runs
+            output_path = Path(nb_config.output_folder) / "processed.ipynb"
+
+            def _write_notebook() -> None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with output_path.open("wb") as handle:
+                    write_notebook_json(notebook, handle)
+
+            _submit_write(_write_notebook, logger)
 
             # if we are using an HTML writer, dynamically add the CSS to the output
             if nb_config.append_css and hasattr(document.settings, "stylesheet"):
@@ -232,9 +432,106 @@ class Parser(MystParser):
         document.attributes.pop("nb_renderer")
 
 
+_PYGMENTS_LEXER_CACHE_SIZE = 32
+_PYGMENTS_LEXER_CACHE: dict[tuple[str, str], Any] = {}
+
+
+class _CachedLexer(Lexer):
+    """A ``code_analyzer.Lexer`` that memoizes the pygments lexer lookup.
+
+    The base class calls ``get_lexer_by_name`` for every code block,
+    re-instantiating the same pygments lexer object for every cell of a
+    notebook, although the cells (nearly) always share a single kernel
+    language; lexer instances are stateless between calls, so they are
+    shared here per (language, tokennames).
+    """
+
+    def __init__(self, code: str, language: str, tokennames: str = "short"):
+        key = (language, tokennames)
+        if key in _PYGMENTS_LEXER_CACHE:
+            self.code = code
+            self.language = language
+            self.tokennames = tokennames
+            self.lexer = _PYGMENTS_LEXER_CACHE[key]
+        else:
+            # this may raise LexerError, in which case nothing is cached
+            # and the lookup (and error) is repeated on the next call
+            super().__init__(code, language, tokennames)
+            while len(_PYGMENTS_LEXER_CACHE) >= _PYGMENTS_LEXER_CACHE_SIZE:
+                _PYGMENTS_LEXER_CACHE.pop(next(iter(_PYGMENTS_LEXER_CACHE)))
+            _PYGMENTS_LEXER_CACHE[key] = self.lexer
+
+
 class DocutilsNbRenderer(DocutilsRenderer, MditRenderMixin):
     """A docutils-only renderer for Jupyter Notebooks."""
 
+    def create_highlighted_code_block(
+        self,
+        text: str,
+        lexer_name: str | None,
+        number_lines: bool = False,
+        lineno_start: int = 1,
+        source: str | None = None,
+        line: int | None = None,
+        node_cls: type[nodes.Element] = nodes.literal_block,
+        emphasize_lines: list[int] | str | None = None,
+    ) -> nodes.Element:
+        """Create a literal block with syntax highlighting.
+
+        This specialises the base implementation for the docutils-only
+        renderer, which lexes the text directly (rather than deferring to a
+        translator, as sphinx does), to reuse the pygments lexer between
+        code blocks via :class:`_CachedLexer`.
+        """
+        if self.sphinx_env is not None:
+            # should not occur for this renderer, but defer to the base
+            # implementation, which records the language for later lexing
+            return super().create_highlighted_code_block(
+                text,
+                lexer_name,
+                number_lines=number_lines,
+                lineno_start=lineno_start,
+                source=source,
+                line=line,
+                node_cls=node_cls,
+                emphasize_lines=emphasize_lines,
+            )
+        node = node_cls(text, classes=["code"] + ([lexer_name] if lexer_name else []))
+        try:
+            lex_tokens = _CachedLexer(
+                text,
+                lexer_name or "",
+                "short" if self.md_config.highlight_code_blocks else "none",
+            )
+        except LexerError as err:
+            self.reporter.warning(
+                str(err),
+                **{
+                    name: value
+                    for name, value in (("source", source), ("line", line))
+                    if value is not None
+                },
+            )
+            lex_tokens = _CachedLexer(text, lexer_name or "", "none")
+
+        if number_lines:
+            lex_tokens = NumberLines(
+                lex_tokens, lineno_start, lineno_start + len(text.splitlines())
+            )
+
+        for classes, value in lex_tokens:
+            if classes:
+                node += nodes.inline(value, value, classes=classes)
+            else:
+                # insert as Text to decrease the verbosity of the output
+                node += nodes.Text(value)
+
+        if source is not None:
+            node.source = source
+        if line is not None:
+            node.line = line
+        return node
+
     def render_nb_initialise(self, token: SyntaxTreeNode) -> None:
         metadata = self.nb_client.nb_metadata
         special_keys = ["kernelspec", "language_info", "source_map"]
@@ -265,82 +562,124 @@ class DocutilsNbRenderer(DocutilsRenderer, MditRenderMixin):
         metadata = token.meta["metadata"]
         line = token_line(token)
         # render the outputs
-        mime_priority = get_mime_priority(
-            self.nb_config.builder_name, self.nb_config.mime_priority_overrides
+        mime_priority = tuple(
+            get_mime_priority(
+                self.nb_config.builder_name, self.nb_config.mime_priority_overrides
+            )
         )
-        for output_index, output in enumerate(outputs):
-            if output.output_type == "stream":
-                if output.name == "stdout":
-                    _nodes = self.nb_renderer.render_stdout(
-                        output, metadata, cell_index, line
+        # restrict the priority list to mime types actually present in the
+        # outputs, so the per-output scans below only probe possible matches
+        present: set[str] = set()
+        for output in outputs:
+            if output.output_type in ("display_data", "execute_result"):
+                present.update(output.get("data", {}))
+        if present:
+            mime_priority = tuple(x for x in mime_priority if x in present)
+        # hoist attribute lookups out of the output loop
+        nb_renderer = self.nb_renderer
+        add_line_and_source_path_r = self.add_line_and_source_path_r
+        current_node = self.current_node
+
+        # stream/error nodes are buffered, so that line/source annotation and
+        # appending are batched into single calls for consecutive outputs
+        pending: list[nodes.Element] = []
+
+        def _flush_pending() -> None:
+            if pending:
+                add_line_and_source_path_r(pending, token)
+                current_node.extend(pending)
+                pending.clear()
+
+        def _render_stream(output: NotebookNode, output_index: int) -> None:
+            if output.name == "stdout":
+                pending.extend(
+                    nb_renderer.render_stdout(output, metadata, cell_index, line)
+                )
+            elif output.name == "stderr":
+                pending.extend(
+                    nb_renderer.render_stderr(output, metadata, cell_index, line)
+                )
+            else:
+                pass  # TODO warning
+
+        def _render_error(output: NotebookNode, output_index: int) -> None:
+            pending.extend(nb_renderer.render_error(output, metadata, cell_index, line))
+
+        def _render_display(output: NotebookNode, output_index: int) -> None:
+            # Note, this is different to the sphinx implementation,
+            # here we directly select a single output, based on the mime_priority,
+            # as opposed to output all mime types, and select in a post-transform
+            # (the mime_priority must then be set for the output format)
+
+            _flush_pending()  # maintain document order
+            data = output["data"]
+            mime_type = None
+            for x in mime_priority:
+                if x in data:
+                    mime_type = x
+                    break
+            if mime_type is None:
+                if data:
+                    create_warning(
+                        self.document,
+                        "No output mime type found from render_priority "
+                        f"(cell<{cell_index}>.output<{output_index}>",
+                        line=line,
+                        append_to=current_node,
+                        # wtype=DEFAULT_LOG_TYPE,
+                        subtype=MystNBWarnings.MIME_TYPE,
                     )
-                    self.add_line_and_source_path_r(_nodes, token)
-                    self.current_node.extend(_nodes)
-                elif output.name == "stderr":
-                    _nodes = self.nb_renderer.render_stderr(
-                        output, metadata, cell_index, line
+            else:
+                figure_options = (
+                    self.get_cell_level_config(
+                        "render_figure_options", metadata, line=line
                     )
-                    self.add_line_and_source_path_r(_nodes, token)
-                    self.current_node.extend(_nodes)
-                else:
-                    pass  # TODO warning
-            elif output.output_type == "error":
-                _nodes = self.nb_renderer.render_error(
-                    output, metadata, cell_index, line
+                    or None
                 )
-                self.add_line_and_source_path_r(_nodes, token)
-                self.current_node.extend(_nodes)
-            elif output.output_type in ("display_data", "execute_result"):
-                # Note, this is different to the sphinx implementation,
-                # here we directly select a single output, based on the mime_priority,
-                # as opposed to output all mime types, and select in a post-transform
-                # (the mime_priority must then be set for the output format)
-
-                try:
-                    mime_type = next(x for x in mime_priority if x in output["data"])
-                except StopIteration:
-                    if output["data"]:
-                        create_warning(
-                            self.document,
-                            "No output mime type found from render_priority "
-                            f"(cell<{cell_index}>.output<{output_index}>",
+
+                with create_figure_context(self, figure_options, line):
+                    _nodes = nb_renderer.render_mime_type(
+                        MimeData(
+                            mime_type,
+                            data[mime_type],
+                            cell_metadata=metadata,
+                            output_metadata=output.get("metadata", {}),
+                            cell_index=cell_index,
+                            output_index=output_index,
                             line=line,
-                            append_to=self.current_node,
-                            # wtype=DEFAULT_LOG_TYPE,
-                            subtype=MystNBWarnings.MIME_TYPE,
-                        )
-                else:
-                    figure_options = (
-                        self.get_cell_level_config(
-                            "render_figure_options", metadata, line=line
-                        )
-                        or None
+                        ),
                     )
+                    # note, the figure context may swap self.current_node,
+                    # so it cannot be aliased to a local here
+                    self.current_node.extend(_nodes)
+                    add_line_and_source_path_r(_nodes, token)
+
+        # dispatch on the output type with a single dict lookup per output,
+        # rather than a chain of string comparisons
+        dispatch: dict[str, Callable[[NotebookNode, int], None]] = {
+            "stream": _render_stream,
+            "error": _render_error,
+            "display_data": _render_display,
+            "execute_result": _render_display,
+        }
 
-                    with create_figure_context(self, figure_options, line):
-                        _nodes = self.nb_renderer.render_mime_type(
-                            MimeData(
-                                mime_type,
-                                output["data"][mime_type],
-                                cell_metadata=metadata,
-                                output_metadata=output.get("metadata", {}),
-                                cell_index=cell_index,
-                                output_index=output_index,
-                                line=line,
-                            ),
-                        )
-                        self.current_node.extend(_nodes)
-                        self.add_line_and_source_path_r(_nodes, token)
+        for output_index, output in enumerate(outputs):
+            handler = dispatch.get(output.output_type)
+            if handler is not None:
+                handler(output, output_index)
             else:
+                _flush_pending()  # maintain document order
                 create_warning(
                     self.document,
                     f"Unsupported output type: {output.output_type}",
                     line=line,
-                    append_to=self.current_node,
+                    append_to=current_node,
                     # wtype=DEFAULT_LOG_TYPE,
                     subtype=MystNBWarnings.OUTPUT_TYPE,
                 )
 
+        _flush_pending()
+
 
 def _run_cli(
     writer_name: str, builder_name: str, writer_description: str, argv: list[str] | None
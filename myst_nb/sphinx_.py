@@ -6,7 +6,7 @@ from html import escape
 import json
 from pathlib import Path
 import re
-from typing import Any, DefaultDict, cast
+from typing import Any, Callable, DefaultDict, cast
 
 from docutils import nodes
 from markdown_it.token import Token
@@ -14,7 +14,6 @@ from markdown_it.tree import SyntaxTreeNode
 from myst_parser.config.main import MdParserConfig, merge_file_level
 from myst_parser.mdit_to_docutils.base import token_line
 from myst_parser.mdit_to_docutils.sphinx_ import SphinxRenderer
-from myst_parser.parsers.mdit import create_md_parser
 from myst_parser.parsers.sphinx_ import MystParser
 import nbformat
 from sphinx.application import Sphinx
@@ -38,6 +37,7 @@ from myst_nb.core.render import (
     get_mime_priority,
     load_renderer,
 )
+from myst_nb.core.utils import create_md_parser_cached, write_notebook_json
 from myst_nb.warnings_ import MystNBWarnings, create_warning
 
 SPHINX_LOGGER = sphinx_logging.getLogger(__name__)
@@ -125,7 +125,7 @@ class Parser(MystParser):
                 )
 
         # Setup the parser
-        mdit_parser = create_md_parser(nb_reader.md_config, SphinxNbRenderer)
+        mdit_parser = create_md_parser_cached(nb_reader.md_config, SphinxNbRenderer)
         mdit_parser.options["document"] = document
         mdit_parser.options["nb_config"] = nb_config
         mdit_renderer: SphinxNbRenderer = mdit_parser.renderer  # type: ignore
@@ -176,10 +176,12 @@ class Parser(MystParser):
                 )
 
         # write final (updated) notebook to output folder (utf8 is standard encoding)
+        # stream the JSON directly to the file, to avoid holding the full
+        # serialized notebook in memory as an intermediate bytes object
         path = self.env.docname.split("/")
         ipynb_path = path[:-1] + [path[-1] + ".ipynb"]
-        content = nbformat.writes(notebook).encode("utf-8")
-        nb_renderer.write_file(ipynb_path, content, overwrite=True)
+        with nb_renderer.write_file_streamed(ipynb_path, overwrite=True) as handle:
+            write_notebook_json(notebook, handle)
 
         # write glue data to the output folder,
         # and store the keys to environment doc metadata,
@@ -241,77 +243,103 @@ class SphinxNbRenderer(SphinxRenderer, MditRenderMixin):
         cell_index = token.meta["index"]
         metadata = token.meta["metadata"]
         # render the outputs
-        for output_index, output in enumerate(outputs):
-            if output.output_type == "stream":
-                if output.name == "stdout":
-                    _nodes = self.nb_renderer.render_stdout(
-                        output, metadata, cell_index, line
-                    )
-                    self.add_line_and_source_path_r(_nodes, token)
-                    self.current_node.extend(_nodes)
-                elif output.name == "stderr":
-                    _nodes = self.nb_renderer.render_stderr(
-                        output, metadata, cell_index, line
-                    )
-                    self.add_line_and_source_path_r(_nodes, token)
-                    self.current_node.extend(_nodes)
-                else:
-                    pass  # TODO warning
-            elif output.output_type == "error":
-                _nodes = self.nb_renderer.render_error(
-                    output, metadata, cell_index, line
+        # hoist attribute lookups out of the output loop
+        nb_renderer = self.nb_renderer
+        add_line_and_source_path_r = self.add_line_and_source_path_r
+        current_node = self.current_node
+
+        # stream/error nodes are buffered, so that line/source annotation and
+        # appending are batched into single calls for consecutive outputs
+        pending: list[nodes.Element] = []
+
+        def _flush_pending() -> None:
+            if pending:
+                add_line_and_source_path_r(pending, token)
+                current_node.extend(pending)
+                pending.clear()
+
+        def _render_stream(output: nbformat.NotebookNode, output_index: int) -> None:
+            if output.name == "stdout":
+                pending.extend(
+                    nb_renderer.render_stdout(output, metadata, cell_index, line)
                 )
-                self.add_line_and_source_path_r(_nodes, token)
-                self.current_node.extend(_nodes)
-            elif output.output_type in ("display_data", "execute_result"):
-                # Note, this is different to the docutils implementation,
-                # where we directly select a single output, based on the mime_priority.
-                # Here, we do not know the mime priority until we know the output format
-                # so we output all the outputs during this parsing phase
-                # (this is what sphinx caches as "output format agnostic" AST),
-                # and replace the mime_bundle with the format specific output
-                # in a post-transform (run per output format on the cached AST)
-
-                figure_options = (
-                    self.get_cell_level_config(
-                        "render_figure_options", metadata, line=line
-                    )
-                    or None
+            elif output.name == "stderr":
+                pending.extend(
+                    nb_renderer.render_stderr(output, metadata, cell_index, line)
                 )
+            else:
+                pass  # TODO warning
+
+        def _render_error(output: nbformat.NotebookNode, output_index: int) -> None:
+            pending.extend(nb_renderer.render_error(output, metadata, cell_index, line))
+
+        def _render_display(output: nbformat.NotebookNode, output_index: int) -> None:
+            # Note, this is different to the docutils implementation,
+            # where we directly select a single output, based on the mime_priority.
+            # Here, we do not know the mime priority until we know the output format
+            # so we output all the outputs during this parsing phase
+            # (this is what sphinx caches as "output format agnostic" AST),
+            # and replace the mime_bundle with the format specific output
+            # in a post-transform (run per output format on the cached AST)
+
+            _flush_pending()  # maintain document order
+            figure_options = (
+                self.get_cell_level_config("render_figure_options", metadata, line=line)
+                or None
+            )
 
-                with create_figure_context(self, figure_options, line):
-                    mime_bundle = nodes.container(nb_element="mime_bundle")
-                    with self.current_node_context(mime_bundle):
-                        for mime_type, data in output["data"].items():
-                            mime_container = nodes.container(mime_type=mime_type)
-                            with self.current_node_context(mime_container):
-                                _nodes = self.nb_renderer.render_mime_type(
-                                    MimeData(
-                                        mime_type,
-                                        data,
-                                        cell_metadata=metadata,
-                                        output_metadata=output.get("metadata", {}),
-                                        cell_index=cell_index,
-                                        output_index=output_index,
-                                        line=line,
-                                    )
+            # note, the figure and container contexts swap self.current_node,
+            # so it cannot be aliased to a local in this handler
+            with create_figure_context(self, figure_options, line):
+                mime_bundle = nodes.container(nb_element="mime_bundle")
+                with self.current_node_context(mime_bundle):
+                    for mime_type, data in output["data"].items():
+                        mime_container = nodes.container(mime_type=mime_type)
+                        with self.current_node_context(mime_container):
+                            _nodes = nb_renderer.render_mime_type(
+                                MimeData(
+                                    mime_type,
+                                    data,
+                                    cell_metadata=metadata,
+                                    output_metadata=output.get("metadata", {}),
+                                    cell_index=cell_index,
+                                    output_index=output_index,
+                                    line=line,
                                 )
-                                self.current_node.extend(_nodes)
-                            if mime_container.children:
-                                self.current_node.append(mime_container)
-                    if mime_bundle.children:
-                        self.add_line_and_source_path_r([mime_bundle], token)
-                        self.current_node.append(mime_bundle)
+                            )
+                            self.current_node.extend(_nodes)
+                        if mime_container.children:
+                            self.current_node.append(mime_container)
+                if mime_bundle.children:
+                    add_line_and_source_path_r([mime_bundle], token)
+                    self.current_node.append(mime_bundle)
+
+        # dispatch on the output type with a single dict lookup per output,
+        # rather than a chain of string comparisons
+        dispatch: dict[str, Callable[[nbformat.NotebookNode, int], None]] = {
+            "stream": _render_stream,
+            "error": _render_error,
+            "display_data": _render_display,
+            "execute_result": _render_display,
+        }
+
+        for output_index, output in enumerate(outputs):
+            handler = dispatch.get(output.output_type)
+            if handler is not None:
+                handler(output, output_index)
             else:
+                _flush_pending()  # maintain document order
                 create_warning(
                     self.document,
                     f"Unsupported output type: {output.output_type}",
                     line=line,
-                    append_to=self.current_node,
+                    append_to=current_node,
                     # wtype=DEFAULT_LOG_TYPE,
                     subtype=MystNBWarnings.OUTPUT_TYPE,
                 )
 
+        _flush_pending()
+
 
 class SelectMimeType(SphinxPostTransform):
     """Select the mime type to render from mime bundles,
@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 
 from docutils.core import publish_doctree, publish_string
+from myst_parser.config.main import MdParserConfig
 import pytest
 import sphinx
 import yaml
@@ -81,3 +82,135 @@ def test_html_resources(tmp_path):
     assert "pygments.css" in result
     assert tmp_path.joinpath("mystnb.css").is_file()
     assert tmp_path.joinpath("pygments.css").is_file()
+
+
+def test_notebook_write_parse_local_state(monkeypatch, tmp_path):
+    """Test deferred notebook writes do not depend on shared parser state."""
+    from myst_nb import docutils_
+
+    # capture the queued writes, and only run them after both parses,
+    # as the worker thread may do when parses arrive back-to-back
+    writes = []
+    monkeypatch.setattr(
+        docutils_, "_submit_write", lambda write, logger: writes.append(write)
+    )
+    source = json.dumps(
+        {"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 4}
+    )
+    for name in ("a", "b"):
+        publish_doctree(
+            source,
+            parser=Parser(),
+            settings_overrides={
+                "nb_execution_mode": "off",
+                "nb_output_folder": str(tmp_path / name),
+            },
+        )
+    for write in writes:
+        write()
+    assert tmp_path.joinpath("a", "processed.ipynb").is_file()
+    assert tmp_path.joinpath("b", "processed.ipynb").is_file()
+
+
+def test_execution_cache_markdown_only_edit(monkeypatch):
+    """Test a markdown-only edit re-uses cached outputs, without re-execution."""
+    from myst_nb import docutils_
+    from myst_nb.core import execute
+
+    monkeypatch.setattr(docutils_, "_NB_EXEC_CACHE", {})
+
+    def _source(markdown: str) -> str:
+        return json.dumps(
+            {
+                "cells": [
+                    {
+                        "cell_type": "code",
+                        "execution_count": None,
+                        "metadata": {},
+                        "outputs": [],
+                        # note, this cell legitimately produces no outputs
+                        "source": "a = 1",
+                    },
+                    {"cell_type": "markdown", "metadata": {}, "source": markdown},
+                ],
+                "metadata": {
+                    "kernelspec": {
+                        "name": "python3",
+                        "display_name": "Python 3",
+                        "language": "python",
+                    }
+                },
+                "nbformat": 4,
+                "nbformat_minor": 4,
+            }
+        )
+
+    def _publish(source: str, **overrides) -> None:
+        report_stream = StringIO()
+        publish_doctree(
+            source,
+            parser=Parser(),
+            settings_overrides={
+                "nb_execution_mode": "auto",
+                "nb_execution_in_temp": True,
+                "nb_output_folder": "",
+                "warning_stream": report_stream,
+                **overrides,
+            },
+        )
+        assert report_stream.getvalue().rstrip() == ""
+
+    _publish(_source("first"))
+    assert len(docutils_._NB_EXEC_CACHE) == 1
+
+    def _no_client(*args, **kwargs):
+        raise AssertionError("execution client should not be created")
+
+    monkeypatch.setattr(execute, "create_client", _no_client)
+    _publish(_source("edited"))
+
+    # changing an execution-relevant configuration must miss the cache
+    with pytest.raises(AssertionError, match="execution client"):
+        _publish(_source("edited"), nb_execution_timeout=120)
+
+
+def test_read_notebook_cached(monkeypatch):
+    """Test memoization of notebook reading."""
+    from nbformat.v4 import new_notebook
+
+    from myst_nb import docutils_
+
+    monkeypatch.setattr(docutils_, "_NB_READ_CACHE", {})
+    reads: list[str] = []
+
+    def _read(text):
+        reads.append(text)
+        return new_notebook()
+
+    config = MdParserConfig()
+    notebook = docutils_._read_notebook_cached(_read, "source", False, config)
+    # a repeated read is served from the cache, as an isolated copy
+    assert docutils_._read_notebook_cached(_read, "source", False, config) is not (
+        notebook
+    )
+    assert reads == ["source"]
+    # a config change must invalidate, also for fields hidden from repr
+    docutils_._read_notebook_cached(
+        _read, "source", False, MdParserConfig(sub_delimiters=("[", "]"))
+    )
+    assert reads == ["source", "source"]
+
+
+def test_read_notebook_cached_eviction(monkeypatch):
+    """Test that the notebook read cache is bounded."""
+    from nbformat.v4 import new_notebook
+
+    from myst_nb import docutils_
+
+    monkeypatch.setattr(docutils_, "_NB_READ_CACHE", {})
+    config = MdParserConfig()
+    for index in range(docutils_._NB_READ_CACHE_SIZE + 2):
+        docutils_._read_notebook_cached(
+            lambda _: new_notebook(), f"source {index}", False, config
+        )
+    assert len(docutils_._NB_READ_CACHE) == docutils_._NB_READ_CACHE_SIZE
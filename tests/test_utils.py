@@ -0,0 +1,78 @@
+"""Tests for shared utilities."""
+from myst_parser.config.main import MdParserConfig
+import nbformat
+from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook, new_output
+import pytest
+
+from myst_nb.core import utils
+from myst_nb.core.utils import (
+    config_fingerprint,
+    create_md_parser_cached,
+    write_notebook_json,
+)
+from myst_nb.docutils_ import DocutilsNbRenderer
+
+
+def test_md_parser_cache_repr_false_fields():
+    """Configs differing only in a ``repr=False`` field must get distinct parsers."""
+    config = MdParserConfig(enable_extensions={"substitution"})
+    other = MdParserConfig(
+        enable_extensions={"substitution"}, sub_delimiters=("[", "]")
+    )
+    assert config_fingerprint(config) != config_fingerprint(other)
+    parser = create_md_parser_cached(config, DocutilsNbRenderer)
+    other_parser = create_md_parser_cached(other, DocutilsNbRenderer)
+    assert parser is not other_parser
+    # equal configs should still share a parser
+    assert create_md_parser_cached(MdParserConfig(), DocutilsNbRenderer) is (
+        create_md_parser_cached(MdParserConfig(), DocutilsNbRenderer)
+    )
+
+
+def _example_notebook() -> nbformat.NotebookNode:
+    notebook = new_notebook(
+        metadata={
+            "kernelspec": {"name": "python3", "display_name": "Python 3"},
+            # transient keys, stripped by nbformat on write
+            "orig_nbformat": 3,
+            "signature": "abc",
+        }
+    )
+    code_cell = new_code_cell(
+        "print('hi')\nprint('bye')",
+        execution_count=1,
+        outputs=[new_output("stream", name="stdout", text="hi\nbye\n")],
+    )
+    code_cell.metadata["trusted"] = True
+    notebook.cells = [code_cell, new_markdown_cell("a *markdown* cell")]
+    return notebook
+
+
+@pytest.mark.skipif(utils.orjson is None, reason="orjson not installed")
+def test_write_notebook_json_orjson_parity(monkeypatch, tmp_path):
+    """The orjson fast path must be read-equivalent to the nbformat fallback."""
+    notebook = _example_notebook()
+    with tmp_path.joinpath("fast.ipynb").open("wb") as stream:
+        write_notebook_json(notebook, stream)
+    monkeypatch.setattr(utils, "orjson", None)
+    with tmp_path.joinpath("fallback.ipynb").open("wb") as stream:
+        write_notebook_json(notebook, stream)
+    fast = tmp_path.joinpath("fast.ipynb").read_text("utf-8")
+    fallback = tmp_path.joinpath("fallback.ipynb").read_text("utf-8")
+    assert nbformat.reads(fast, as_version=4) == nbformat.reads(fallback, as_version=4)
+    # the input notebook must not be mutated by the transient key stripping
+    assert notebook.metadata["orig_nbformat"] == 3
+    assert notebook.cells[0].metadata["trusted"] is True
+
+
+@pytest.mark.skipif(utils.orjson is None, reason="orjson not installed")
+def test_write_notebook_json_64bit_overflow(tmp_path):
+    """Values orjson cannot encode must fall back to the stdlib writer."""
+    notebook = _example_notebook()
+    # Python ints are unbounded, orjson only supports 64-bit integers
+    notebook.cells[0].metadata["big"] = 2**70
+    path = tmp_path.joinpath("big.ipynb")
+    with path.open("wb") as stream:
+        write_notebook_json(notebook, stream)
+    read = nbformat.reads(path.read_text("utf-8"), as_version=4)
+    assert read.cells[0].metadata["big"] == 2**70